@@ -7,16 +7,34 @@ Provider-aware: Handles OpenAI, Anthropic, Google, HuggingFace formats.
 
 from __future__ import annotations
 
+import random
+import time
 from dataclasses import dataclass
 from typing import Any, Optional
 
 import requests
+from urllib3.exceptions import ReadTimeoutError
 
 from lutum.core.api_config import get_api_base_url, get_api_headers, get_provider
 from lutum.core.log_config import get_logger
 
 logger = get_logger(__name__)
 
+# Shared HTTP session - keeps connections (TCP + TLS) to the provider alive
+# across LLM calls instead of a fresh handshake per request.
+_SESSION = requests.Session()
+
+
+def get_http_session() -> requests.Session:
+    """Shared requests.Session for all LLM API calls."""
+    return _SESSION
+
+
+# Transient failures (rate limit, gateway/overload) are retried with backoff
+_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+_MAX_ATTEMPTS = 4
+_MAX_RETRY_DELAY = 30.0
+
 
 @dataclass
 class LLMCallResult:
@@ -136,6 +154,62 @@ def _get_finish_reason(result: dict, provider: str) -> str:
         return "unknown"
 
 
+def _retry_delay(attempt: int, response: Optional[requests.Response] = None) -> float:
+    """Retry-After header if the provider sends one (seconds), else jittered exponential backoff."""
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(max(float(retry_after), 0.0), _MAX_RETRY_DELAY)
+            except ValueError:
+                pass  # HTTP-date format - fall back to backoff
+    return min(2 ** attempt + random.random(), _MAX_RETRY_DELAY)
+
+
+def _post_with_retry(url: str, request_body: dict, timeout: int, provider: str) -> requests.Response:
+    """
+    POSTs the request, retrying connection errors and 429/5xx responses.
+
+    Read timeouts are not retried - the model was generating, a second
+    attempt would most likely run into the same timeout. This includes a
+    timeout while the body is read, which requests reports as ConnectionError;
+    it is re-raised as requests.ReadTimeout.
+    The last response is returned as-is, the caller handles non-ok status.
+    """
+    attempt = 0
+    while True:
+        last_attempt = attempt == _MAX_ATTEMPTS - 1
+        try:
+            response = _SESSION.post(
+                url,
+                headers=get_api_headers(),
+                json=request_body,
+                timeout=timeout
+            )
+        except requests.ConnectionError as e:
+            # requests wraps urllib3's ReadTimeoutError during the body read in a ConnectionError
+            if e.args and isinstance(e.args[0], ReadTimeoutError):
+                raise requests.ReadTimeout(*e.args, request=e.request, response=e.response) from e
+            if last_attempt:
+                raise
+            delay = _retry_delay(attempt)
+            logger.warning(
+                "LLM connection failed (%s): %s - retry %d/%d in %.1fs",
+                provider, e, attempt + 1, _MAX_ATTEMPTS - 1, delay,
+            )
+        else:
+            if response.status_code not in _RETRY_STATUS_CODES or last_attempt:
+                return response
+            delay = _retry_delay(attempt, response)
+            logger.warning(
+                "LLM API returned HTTP %d (%s) - retry %d/%d in %.1fs",
+                response.status_code, provider, attempt + 1, _MAX_ATTEMPTS - 1, delay,
+            )
+
+        time.sleep(delay)
+        attempt += 1
+
+
 def call_chat_completion(
     messages: list[dict[str, str]],
     model: str,
@@ -156,12 +230,7 @@ def call_chat_completion(
     logger.debug(f"[LLM] Provider: {provider}, Model: {model}, max_tokens: {max_tokens}")
 
     try:
-        response = requests.post(
-            url,
-            headers=get_api_headers(),
-            json=request_body,
-            timeout=timeout
-        )
+        response = _post_with_retry(url, request_body, timeout, provider)
 
         if not response.ok:
             try:
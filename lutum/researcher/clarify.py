@@ -143,8 +143,8 @@ async def get_clarification(user_message: str, urls: list[str]) -> dict:
         # Format for LLM
         formatted = _format_scraped_for_llm(scraped)
 
-        # LLM follow-up questions
-        clarification, error_message = _call_llm_clarify(user_message, formatted)
+        # LLM follow-up questions (sync call incl. retry backoff -> thread, keeps the event loop free)
+        clarification, error_message = await asyncio.to_thread(_call_llm_clarify, user_message, formatted)
 
         if not clarification:
             return {
@@ -17,6 +17,9 @@ from lutum.researcher.context_state import ContextState
 
 logger = get_logger(__name__)
 
+# Pattern: (1), (2), etc. at line start - compiled once, used on every plan parse
+_PLAN_POINT_PATTERN = re.compile(r'\((\d+)\)\s*(.+?)(?=\n\(\d+\)|\n\n|\Z)', re.DOTALL)
+
 
 PLAN_SYSTEM_PROMPT = """You are a research expert who creates deep, reproducible research plans.
 
@@ -233,14 +236,12 @@ def _parse_plan_points(text: str) -> list[str]:
     Returns:
         List of plan points (without numbering)
     """
-    # Pattern: (1), (2), etc. at line start
-    pattern = r'\((\d+)\)\s*(.+?)(?=\n\(\d+\)|\n\n|\Z)'
-    matches = re.findall(pattern, text, re.DOTALL)
-
+    # Single sweep: scan matches lazily and normalize whitespace in the same pass.
+    # str.split()/join runs in C and beats a regex sub + strip on real plan output.
     points = []
-    for num, content in matches:
+    for match in _PLAN_POINT_PATTERN.finditer(text):
         # Cleanup: line breaks to spaces, trim
-        clean_content = " ".join(content.split())
+        clean_content = " ".join(match.group(2).split())
         if clean_content:
             points.append(clean_content)
 
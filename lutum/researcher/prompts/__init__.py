@@ -16,8 +16,12 @@ ACADEMIC MODE FLOW:
    - BEREICHS_SYNTHESE (pro Bereich)
 3. META_SYNTHESIS - Querverbindungen zwischen Bereichen
 4. FINAL_SYNTHESIS - Alles zusammen
+
+Academic Mode Prompts werden erst beim ersten Zugriff importiert.
 """
 
+import importlib
+
 from .think import (
     build_think_prompt,
     parse_think_response,
@@ -47,38 +51,53 @@ from .final_synthesis import (
     FINAL_SYNTHESIS_TIMEOUT,
 )
 
-# Academic Mode Prompts
-from .academic_plan import (
-    create_academic_plan,
-    parse_academic_plan,
-    format_academic_plan,
-    ACADEMIC_PLAN_SYSTEM_PROMPT,
-)
+# Academic Mode Prompts - loaded lazily on first access (PEP 562).
+# Normal mode only needs the four modules above; the academic prompts are
+# large and imported only when an academic run actually touches them.
+_LAZY_IMPORTS = {
+    # Academic Plan
+    "create_academic_plan": "academic_plan",
+    "parse_academic_plan": "academic_plan",
+    "format_academic_plan": "academic_plan",
+    "ACADEMIC_PLAN_SYSTEM_PROMPT": "academic_plan",
+    "ACADEMIC_PLAN_SYSTEM_PROMPT_LEN": "academic_plan",
+    # Meta Synthesis
+    "build_meta_synthesis_prompt": "meta_synthesis",
+    "parse_meta_synthesis_response": "meta_synthesis",
+    "META_SYNTHESIS_SYSTEM_PROMPT": "meta_synthesis",
+    "META_SYNTHESIS_USER_PROMPT": "meta_synthesis",
+    "META_SYNTHESIS_MODEL": "meta_synthesis",
+    "META_SYNTHESIS_TIMEOUT": "meta_synthesis",
+    # NEU: Bereichs-Synthese (jeder Bereich = eigener LLM Call)
+    "build_bereichs_synthesis_prompt": "bereichs_synthesis",
+    "BEREICHS_SYNTHESIS_SYSTEM_PROMPT": "bereichs_synthesis",
+    "BEREICHS_SYNTHESIS_MODEL": "bereichs_synthesis",
+    "BEREICHS_SYNTHESIS_TIMEOUT": "bereichs_synthesis",
+    # NEU: Academic Conclusion (DER magische finale Call)
+    "build_academic_conclusion_prompt": "academic_conclusion",
+    "ACADEMIC_CONCLUSION_SYSTEM_PROMPT": "academic_conclusion",
+    "ACADEMIC_CONCLUSION_MAX_CHARS_PER_AREA": "academic_conclusion",
+    "ACADEMIC_CONCLUSION_SYSTEM_PROMPT_LEN": "academic_conclusion",
+    "ACADEMIC_CONCLUSION_MODEL": "academic_conclusion",
+    "ACADEMIC_CONCLUSION_TIMEOUT": "academic_conclusion",
+}
 
-from .meta_synthesis import (
-    build_meta_synthesis_prompt,
-    parse_meta_synthesis_response,
-    META_SYNTHESIS_SYSTEM_PROMPT,
-    META_SYNTHESIS_USER_PROMPT,
-    META_SYNTHESIS_MODEL,
-    META_SYNTHESIS_TIMEOUT,
-)
 
-# NEU: Bereichs-Synthese (jeder Bereich = eigener LLM Call)
-from .bereichs_synthesis import (
-    build_bereichs_synthesis_prompt,
-    BEREICHS_SYNTHESIS_SYSTEM_PROMPT,
-    BEREICHS_SYNTHESIS_MODEL,
-    BEREICHS_SYNTHESIS_TIMEOUT,
-)
+def __getattr__(name: str):
+    """Imports academic submodules on first attribute access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value  # Cache: next access skips __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-# NEU: Academic Conclusion (DER magische finale Call)
-from .academic_conclusion import (
-    build_academic_conclusion_prompt,
-    ACADEMIC_CONCLUSION_SYSTEM_PROMPT,
-    ACADEMIC_CONCLUSION_MODEL,
-    ACADEMIC_CONCLUSION_TIMEOUT,
-)
 
 __all__ = [
     # Think
@@ -107,6 +126,7 @@ __all__ = [
     "parse_academic_plan",
     "format_academic_plan",
     "ACADEMIC_PLAN_SYSTEM_PROMPT",
+    "ACADEMIC_PLAN_SYSTEM_PROMPT_LEN",
     # Meta Synthesis
     "build_meta_synthesis_prompt",
     "parse_meta_synthesis_response",
@@ -122,6 +142,8 @@ __all__ = [
     # Academic Conclusion
     "build_academic_conclusion_prompt",
     "ACADEMIC_CONCLUSION_SYSTEM_PROMPT",
+    "ACADEMIC_CONCLUSION_MAX_CHARS_PER_AREA",
+    "ACADEMIC_CONCLUSION_SYSTEM_PROMPT_LEN",
     "ACADEMIC_CONCLUSION_MODEL",
     "ACADEMIC_CONCLUSION_TIMEOUT",
 ]
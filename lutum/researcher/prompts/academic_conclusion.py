@@ -20,7 +20,9 @@ Its task:
 - The ANSWER to the original question
 """
 
+import hashlib
 import logging
+from typing import Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -270,90 +272,216 @@ NO LENGTH LIMIT - write as many paragraphs as needed to be thorough and complete
 
 CRITICAL - LANGUAGE: Always respond in the same language as the user's original query shown below."""
 
+# Precomputed once at import - the prompt-size log reports the static system length
+ACADEMIC_CONCLUSION_SYSTEM_PROMPT_LEN = len(ACADEMIC_CONCLUSION_SYSTEM_PROMPT)
 
-def build_academic_conclusion_prompt(
-    user_query: str,
-    bereichs_synthesen: list[dict],
-    total_raw_chars: int = 0,
-    total_dossiers: int = 0,
-) -> tuple[str, str, dict]:
+
+# Area separator - built once instead of twice per area on every call
+_SEP70 = "═" * 70
+
+# Banner boxes of the research overview - materialized once at import
+_OVERVIEW_BANNER = """╔══════════════════════════════════════════════════════════════════════╗
+║                        RESEARCH OVERVIEW                              ║
+╚══════════════════════════════════════════════════════════════════════╝"""
+
+_AREA_SYNTHESES_BANNER = """╔══════════════════════════════════════════════════════════════════════╗
+║                      AREA SYNTHESES                                   ║
+╚══════════════════════════════════════════════════════════════════════╝"""
+
+# Paragraphs (and whole area syntheses) shorter than this are never deduplicated across areas
+_DEDUPE_MIN_PARAGRAPH_CHARS = 200
+# Opening of a repeated paragraph quoted in its back-reference
+_DEDUPE_QUOTE_CHARS = 80
+
+_TRUNCATION_MARKER = "\n\n[...TRUNCATED FOR CONTEXT BUDGET...]\n\n"
+
+# Soft cap per area synthesis for the conclusion prompt. A regular area synthesis
+# (32k max_tokens) stays well below it; this only bounds runaway outputs and the
+# dossier-concatenation fallback when an area synthesis call failed.
+ACADEMIC_CONCLUSION_MAX_CHARS_PER_AREA = 150_000
+
+# Fixed opening of the user prompt and banner of the closing task section
+_USER_PROMPT_PREFIX = """
+╔══════════════════════════════════════════════════════════════════════╗
+║                    ORIGINAL RESEARCH QUESTION                         ║
+╚══════════════════════════════════════════════════════════════════════╝
+
+"""
+
+_YOUR_TASK_BANNER = """╔══════════════════════════════════════════════════════════════════════╗
+║                         YOUR TASK                                     ║
+╚══════════════════════════════════════════════════════════════════════╝"""
+
+
+def _truncate_middle(text: str, budget: int) -> str:
     """
-    Builds the FINAL prompt - the magic call.
+    Cuts text to budget chars, keeping head and tail.
 
-    Args:
-        user_query: The ORIGINAL user question (exact!)
-        bereichs_synthesen: List of {bereich_titel, synthese, sources_count, dossiers}
-        total_raw_chars: Total characters of raw scraped data (optional)
-        total_dossiers: Total number of dossiers created (optional)
+    Area syntheses start with the key findings and end with the summary -
+    the middle (deep analysis) is the part the conclusion can lose best.
+    """
+    if budget <= 0 or len(text) <= budget:
+        return text
+    head = budget // 2
+    return text[:head] + _TRUNCATION_MARKER + text[-(budget - head):]
+
+
+def _paragraph_reference(area_idx: int, paragraph: str) -> str:
+    """Back-reference for a repeated paragraph, quoting its opening so the LLM can find it."""
+    opening = paragraph.split("\n", 1)[0]
+    if len(opening) > _DEDUPE_QUOTE_CHARS:
+        opening = opening[:_DEDUPE_QUOTE_CHARS] + "..."
+    return f'[Same as AREA {area_idx}: "{opening}"]'
+
+
+def _dedupe_paragraphs(texts: list[str]) -> tuple[list[str], int]:
+    """
+    Replaces paragraphs that already appeared in an earlier area by a back-reference.
+
+    Worker AIs of different areas often produce the same definition or methodology
+    paragraph. Only exact repeats of long paragraphs are replaced - short ones
+    (headers, separators, list stubs) repeat legitimately. An area whose whole
+    synthesis repeats an earlier one (retry double-insert, degenerate plan) is
+    replaced by a single back-reference.
 
     Returns:
-        (system_prompt, user_prompt, metrics)
-        metrics = {total_sources, total_synthese_chars, total_dossiers, total_raw_chars}
+        (deduplicated texts, number of chars removed)
     """
+    seen: dict[bytes, int] = {}
+    seen_texts: dict[bytes, int] = {}
+    deduplicated_chars = 0
+    result = []
+
+    for area_idx, text in enumerate(texts, 1):
+        stripped_text = text.strip()
+        if len(stripped_text) >= _DEDUPE_MIN_PARAGRAPH_CHARS:
+            text_digest = hashlib.blake2b(stripped_text.encode("utf-8"), digest_size=16).digest()
+            first_area = seen_texts.setdefault(text_digest, area_idx)
+            if first_area != area_idx:
+                logger.warning("Academic Conclusion: area %d repeats area %d, replaced", area_idx, first_area)
+                reference = f"[Same as AREA {first_area}]"
+                deduplicated_chars += len(text) - len(reference)
+                result.append(reference)
+                continue
+
+        paragraphs = text.split("\n\n")
+        changed = False
+        for para_idx, paragraph in enumerate(paragraphs, 1):
+            stripped = paragraph.strip()
+            if len(stripped) < _DEDUPE_MIN_PARAGRAPH_CHARS:
+                continue
+            digest = hashlib.blake2b(stripped.encode("utf-8"), digest_size=8).digest()
+            first = seen.get(digest)
+            if first is None:
+                seen[digest] = area_idx
+            elif first != area_idx:
+                paragraphs[para_idx - 1] = _paragraph_reference(first, stripped)
+                deduplicated_chars += len(paragraph) - len(paragraphs[para_idx - 1])
+                changed = True
+        result.append("\n\n".join(paragraphs) if changed else text)
+
+    return result, deduplicated_chars
+
+
+def _prepare_syntheses(
+    bereichs_synthesen: list[dict],
+    total_raw_chars: int,
+    total_dossiers: int,
+    max_chars_per_area: int,
+    dedupe_paragraphs: bool,
+) -> tuple[list[str], dict]:
+    """
+    Computes the synthesis texts as they go into the prompt, plus the metrics.
 
-    # Calculate metrics
-    synthesen_text = ""
+    Returns:
+        (synthese_texts, metrics)
+    """
     total_sources = 0
     total_synthese_chars = 0
     calculated_dossiers = 0
+    synthese_texts = []
 
-    for i, s in enumerate(bereichs_synthesen, 1):
-        total_sources += s.get('sources_count', 0)
+    for s in bereichs_synthesen:
         synthese = s.get('synthese', '')
+        total_sources += s.get('sources_count', 0)
         total_synthese_chars += len(synthese)
         calculated_dossiers += len(s.get('dossiers', []))
-
-        synthesen_text += f"\n{'═'*70}\n"
-        synthesen_text += f"AREA {i}: {s['bereich_titel']}\n"
-        synthesen_text += f"Sources in this area: {s.get('sources_count', 'N/A')}\n"
-        synthesen_text += f"{'═'*70}\n\n"
-        synthesen_text += synthese
-        synthesen_text += "\n"
+        synthese_texts.append(synthese)
+
+    truncated_areas = 0
+    if max_chars_per_area > 0:
+        for i, text in enumerate(synthese_texts):
+            if len(text) > max_chars_per_area:
+                synthese_texts[i] = _truncate_middle(text, max_chars_per_area)
+                truncated_areas += 1
+                logger.warning(
+                    "Academic Conclusion: area %d synthesis truncated from %d to %d chars",
+                    i + 1, len(text), max_chars_per_area,
+                )
+
+    # Dedupe after truncation - back-references only point at text that is still in the prompt
+    deduplicated_chars = 0
+    if dedupe_paragraphs and len(synthese_texts) > 1:
+        synthese_texts, deduplicated_chars = _dedupe_paragraphs(synthese_texts)
 
     # Use provided or calculated values
     final_dossiers = total_dossiers if total_dossiers > 0 else calculated_dossiers
 
-    # Metrics for the impact statement
     metrics = {
         "total_sources": total_sources,
         "total_synthese_chars": total_synthese_chars,
         "total_dossiers": final_dossiers,
         "total_raw_chars": total_raw_chars,
         "total_areas": len(bereichs_synthesen),
+        "truncated_areas": truncated_areas,
+        "deduplicated_chars": deduplicated_chars,
     }
+    return synthese_texts, metrics
 
-    user_prompt = f"""
-╔══════════════════════════════════════════════════════════════════════╗
-║                    ORIGINAL RESEARCH QUESTION                         ║
-╚══════════════════════════════════════════════════════════════════════╝
 
-"{user_query}"
+def _iter_user_prompt_parts(
+    user_query: str,
+    bereichs_synthesen: list[dict],
+    synthese_texts: list[str],
+    metrics: dict,
+) -> Iterator[str]:
+    """Yields the user prompt piece by piece: question + overview, each area, task."""
+    total_raw_chars = metrics["total_raw_chars"]
 
-╔══════════════════════════════════════════════════════════════════════╗
-║                        RESEARCH OVERVIEW                              ║
-╚══════════════════════════════════════════════════════════════════════╝
+    yield _USER_PROMPT_PREFIX
+    yield f"""\"{user_query}"
+
+{_OVERVIEW_BANNER}
 
-Number of independent areas: {len(bereichs_synthesen)}
-Total number of analyzed sources: {total_sources}
-Total dossiers created by worker AIs: {final_dossiers}
-Total characters of synthesized knowledge: {total_synthese_chars:,}
+Number of independent areas: {metrics['total_areas']}
+Total number of analyzed sources: {metrics['total_sources']}
+Total dossiers created by worker AIs: {metrics['total_dossiers']}
+Total characters of synthesized knowledge: {metrics['total_synthese_chars']:,}
 {f"Total characters of raw data processed: {total_raw_chars:,}" if total_raw_chars > 0 else ""}
 
 The following areas were researched INDEPENDENTLY of each other.
 Each area had its own search strategies, own sources, own analysis.
 You see them together for the FIRST TIME now.
 
-╔══════════════════════════════════════════════════════════════════════╗
-║                      AREA SYNTHESES                                   ║
-╚══════════════════════════════════════════════════════════════════════╝
-{synthesen_text}
+{_AREA_SYNTHESES_BANNER}
+"""
 
-╔══════════════════════════════════════════════════════════════════════╗
-║                         YOUR TASK                                     ║
-╚══════════════════════════════════════════════════════════════════════╝
+    for i, (s, synthese) in enumerate(zip(bereichs_synthesen, synthese_texts), 1):
+        yield (
+            f"\n{_SEP70}\n"
+            f"AREA {i}: {s['bereich_titel']}\n"
+            f"Sources in this area: {s.get('sources_count', 'N/A')}\n"
+            f"{_SEP70}\n\n"
+        )
+        yield synthese
+        yield "\n"
+
+    yield f"""
 
-You now have access to {len(bereichs_synthesen)} independent research perspectives
-based on {total_sources} analyzed sources.
+{_YOUR_TASK_BANNER}
+
+You now have access to {metrics['total_areas']} independent research perspectives
+based on {metrics['total_sources']} analyzed sources.
 
 FIND:
 1. Cross-connections between areas
@@ -364,6 +492,45 @@ FIND:
 
 This is your moment. Think deep. Be brilliant."""
 
-    logger.info(f"Academic Conclusion prompt: {len(user_prompt)} chars, {len(bereichs_synthesen)} areas, {total_sources} sources")
+
+def build_academic_conclusion_prompt(
+    user_query: str,
+    bereichs_synthesen: list[dict],
+    total_raw_chars: int = 0,
+    total_dossiers: int = 0,
+    max_chars_per_area: int = 0,
+    dedupe_paragraphs: bool = False,
+) -> tuple[str, str, dict]:
+    """
+    Builds the FINAL prompt - the magic call.
+
+    Args:
+        user_query: The ORIGINAL user question (exact!)
+        bereichs_synthesen: List of {bereich_titel, synthese, sources_count, dossiers}
+        total_raw_chars: Total characters of raw scraped data (optional)
+        total_dossiers: Total number of dossiers created (optional)
+        max_chars_per_area: Budget per area synthesis, longer ones keep head + tail
+            (optional, 0 = no limit)
+        dedupe_paragraphs: Replace long paragraphs repeated from an earlier area
+            by a back-reference (optional, default off)
+
+    Returns:
+        (system_prompt, user_prompt, metrics)
+        metrics = {total_sources, total_synthese_chars, total_dossiers, total_raw_chars,
+                   total_areas, truncated_areas, deduplicated_chars}
+    """
+    synthese_texts, metrics = _prepare_syntheses(
+        bereichs_synthesen, total_raw_chars, total_dossiers, max_chars_per_area, dedupe_paragraphs
+    )
+
+    # Join once - "+=" would re-copy the growing text per area
+    user_prompt = "".join(_iter_user_prompt_parts(user_query, bereichs_synthesen, synthese_texts, metrics))
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Academic Conclusion prompt: %d chars (+%d system), %d areas, %d sources",
+            len(user_prompt), ACADEMIC_CONCLUSION_SYSTEM_PROMPT_LEN,
+            len(bereichs_synthesen), metrics['total_sources'],
+        )
 
     return ACADEMIC_CONCLUSION_SYSTEM_PROMPT, user_prompt, metrics
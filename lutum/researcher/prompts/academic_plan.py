@@ -17,15 +17,29 @@ v2.0 UPDATES:
 - Parser-compatible format
 """
 
+import hashlib
+import logging
 import re
-from typing import Optional
+import sys
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Iterator, Optional
 from lutum.core.log_config import get_logger
-from lutum.core.api_config import get_work_model
+from lutum.core.api_config import get_api_base_url, get_provider, get_work_model
 from lutum.core.llm_client import call_chat_completion
 from lutum.researcher.context_state import ContextState
 
 logger = get_logger(__name__)
 
+# Parser patterns - compiled once at import instead of on every parse
+# Area header (supports both AREA and BEREICH for compatibility).
+# Exactly one capture group (the title) - parse_academic_plan splits on it.
+_BEREICH_RE = re.compile(r'===\s*(?:AREA|BEREICH)\s*\d+:\s*(.+?)\s*===', re.IGNORECASE)
+_END_PLAN_RE = re.compile(r'===\s*END\s*PLAN\s*===', re.IGNORECASE)
+# Start of a point inside an area: "1) Text" or "- Text"
+_PUNKT_START_RE = re.compile(r'\s*(?:\d+\)|-)\s*(.*)')
+
 
 ACADEMIC_PLAN_SYSTEM_PROMPT = """You are a research architect creating multi-disciplinary research plans.
 
@@ -145,6 +159,47 @@ Question: "Is nuclear fusion a realistic energy source?"
 
 CRITICAL - LANGUAGE: Always respond in the same language as the user's original query shown below."""
 
+# Precomputed once at import - the prompt-size log reports the static system length
+ACADEMIC_PLAN_SYSTEM_PROMPT_LEN = len(ACADEMIC_PLAN_SYSTEM_PROMPT)
+
+
+# === RESPONSE CACHE ===
+# Identical plan requests (replays of the same context) reuse the last answer
+# that parsed into a usable plan instead of paying for another multi-second
+# LLM call. Malformed plans are never cached, so a retry asks the LLM again.
+# In-process only, bounded, entries expire after 24h.
+_RESPONSE_CACHE_TTL_SECONDS = 24 * 60 * 60
+_RESPONSE_CACHE_MAX_ENTRIES = 64
+_response_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+_response_cache_lock = Lock()
+
+
+def _response_cache_key(model: str, user_prompt: str) -> str:
+    """Cache key over everything that changes the plan answer."""
+    key_source = f"{get_provider()}|{get_api_base_url()}|{model}|{user_prompt}"
+    return hashlib.blake2b(key_source.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _get_cached_response(key: str) -> Optional[str]:
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, answer = entry
+        if time.monotonic() - stored_at > _RESPONSE_CACHE_TTL_SECONDS:
+            del _response_cache[key]
+            return None
+        _response_cache.move_to_end(key)
+        return answer
+
+
+def _store_cached_response(key: str, answer: str) -> None:
+    with _response_cache_lock:
+        _response_cache[key] = (time.monotonic(), answer)
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > _RESPONSE_CACHE_MAX_ENTRIES:
+            _response_cache.popitem(last=False)
+
 
 def _call_llm(system_prompt: str, user_prompt: str, max_tokens: int = 3000) -> tuple[Optional[str], Optional[str]]:
     """
@@ -155,25 +210,28 @@ def _call_llm(system_prompt: str, user_prompt: str, max_tokens: int = 3000) -> t
         - Success: (text, None)
         - Failure: (None, error_string)
     """
+    model = get_work_model()
+
     result = call_chat_completion(
         messages=[
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
         ],
-        model=get_work_model(),
+        model=model,
         max_tokens=max_tokens,
-        timeout=90
+        timeout=90,
     )
 
     if result.error:
-        logger.error(f"LLM error: {result.error}")
+        logger.error("LLM error: %s", result.error)
         return None, result.error
 
     if not result.content:
         return None, "LLM response empty"
 
     answer = str(result.content)
-    logger.info(f"[ACADEMIC PLAN] RAW LLM RESPONSE:\n{answer[:2000]}...")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("[ACADEMIC PLAN] RAW LLM RESPONSE:\n%s...", answer[:2000])
     return answer, None
 
 
@@ -211,24 +269,35 @@ IMPORTANT:
 
 Respond in the same language as the original query!"""
 
-        logger.debug(f"Academic plan prompt length: {len(user_prompt)} chars")
+        logger.debug(
+            "Academic plan prompt length: %d chars (+%d system)",
+            len(user_prompt), ACADEMIC_PLAN_SYSTEM_PROMPT_LEN,
+        )
 
-        raw_response, llm_error = _call_llm(ACADEMIC_PLAN_SYSTEM_PROMPT, user_prompt)
+        cache_key = _response_cache_key(get_work_model(), user_prompt)
+        raw_response = _get_cached_response(cache_key)
+        if raw_response is not None:
+            logger.info("[ACADEMIC PLAN] Response cache hit, skipping LLM call")
+        else:
+            raw_response, llm_error = _call_llm(ACADEMIC_PLAN_SYSTEM_PROMPT, user_prompt)
 
-        if llm_error:
-            return {"error": llm_error, "bereiche": {}}
+            if llm_error:
+                return {"error": llm_error, "bereiche": {}}
 
-        if not raw_response:
-            return {"error": "Empty response from LLM", "bereiche": {}}
+            if not raw_response:
+                return {"error": "Empty response from LLM", "bereiche": {}}
 
         # Parse areas
         bereiche = parse_academic_plan(raw_response)
 
         if len(bereiche) < 2:
-            logger.warning(f"Only {len(bereiche)} areas found, expected at least 3")
+            logger.warning("Only %d areas found, expected at least 3", len(bereiche))
+        else:
+            # Only cache answers that parsed into a usable plan
+            _store_cached_response(cache_key, raw_response)
 
         total_points = sum(len(points) for points in bereiche.values())
-        logger.info(f"[ACADEMIC PLAN] Parsed {len(bereiche)} areas with {total_points} total points")
+        logger.info("[ACADEMIC PLAN] Parsed %d areas with %d total points", len(bereiche), total_points)
 
         return {
             "bereiche": bereiche,
@@ -238,10 +307,37 @@ Respond in the same language as the original query!"""
         }
 
     except Exception as e:
-        logger.error(f"Academic plan generation failed: {e}", exc_info=True)
+        logger.error("Academic plan generation failed: %s", e, exc_info=True)
         return {"error": str(e), "bereiche": {}}
 
 
+def _iter_punkte(bereich_content: str) -> Iterator[str]:
+    """
+    Splits the body of one area into its raw points.
+
+    Single pass over the lines: a line starting with "N)" or "-" opens a new
+    point, following lines are continuations, a "===" line closes the point.
+    No regex backtracking across the whole area body.
+    """
+    current: Optional[list[str]] = None
+
+    for line in bereich_content.splitlines():
+        start = _PUNKT_START_RE.match(line)
+        if start:
+            if current:
+                yield " ".join(current)
+            current = [start.group(1)]
+        elif line.lstrip().startswith("==="):
+            if current:
+                yield " ".join(current)
+            current = None
+        elif current is not None:
+            current.append(line)
+
+    if current:
+        yield " ".join(current)
+
+
 def parse_academic_plan(text: str) -> dict[str, list[str]]:
     """
     Parses the hierarchical Academic Plan.
@@ -260,43 +356,32 @@ def parse_academic_plan(text: str) -> dict[str, list[str]]:
     """
     bereiche = {}
 
-    # Pattern for area header (supports both AREA and BEREICH for compatibility)
-    bereich_pattern = r'===\s*(?:AREA|BEREICH)\s*\d+:\s*(.+?)\s*==='
-
-    # Find all area headers and their positions
-    headers = list(re.finditer(bereich_pattern, text, re.IGNORECASE))
+    # One split over the whole text: [preamble, title1, body1, title2, body2, ...]
+    parts = _BEREICH_RE.split(text)
+    last_body = len(parts) - 1
 
-    for i, header_match in enumerate(headers):
-        bereich_titel = header_match.group(1).strip()
+    for i in range(1, len(parts), 2):
+        # Interned: titles repeat across plans and are used as dict keys downstream
+        bereich_titel = sys.intern(parts[i].strip())
 
-        # Content between this header and the next (or END PLAN)
-        start_pos = header_match.end()
-        if i + 1 < len(headers):
-            end_pos = headers[i + 1].start()
-        else:
-            # Until END PLAN or end
-            end_match = re.search(r'===\s*END\s*PLAN\s*===', text[start_pos:], re.IGNORECASE)
+        # Content until the next header - the last area ends at END PLAN (or end of text)
+        bereich_content = parts[i + 1]
+        if i + 1 == last_body:
+            end_match = _END_PLAN_RE.search(bereich_content)
             if end_match:
-                end_pos = start_pos + end_match.start()
-            else:
-                end_pos = len(text)
-
-        bereich_content = text[start_pos:end_pos]
+                bereich_content = bereich_content[:end_match.start()]
 
         # Extract points from the area
         # Format: 1) Text or - Text
-        punkt_pattern = r'(?:^\s*\d+\)|\s*-)\s*(.+?)(?=\n\s*\d+\)|\n\s*-|\n\s*===|\Z)'
-        punkt_matches = re.findall(punkt_pattern, bereich_content, re.MULTILINE | re.DOTALL)
-
         punkte = []
-        for punkt in punkt_matches:
-            clean_punkt = " ".join(punkt.split()).strip()
+        for punkt in _iter_punkte(bereich_content):
+            clean_punkt = " ".join(punkt.split())
             if clean_punkt and len(clean_punkt) > 10:  # Minimum length for meaningful point
                 punkte.append(clean_punkt)
 
         if punkte:
             bereiche[bereich_titel] = punkte
-            logger.info(f"[ACADEMIC PLAN] Area '{bereich_titel}': {len(punkte)} points")
+            logger.info("[ACADEMIC PLAN] Area '%s': %d points", bereich_titel, len(punkte))
 
     return bereiche
 
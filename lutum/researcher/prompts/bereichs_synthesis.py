@@ -10,6 +10,7 @@ Focused, compressed, no distraction from other areas.
 """
 
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +18,14 @@ logger = logging.getLogger(__name__)
 BEREICHS_SYNTHESIS_MODEL = "qwen/qwen3-vl-235b-a22b-instruct"
 BEREICHS_SYNTHESIS_TIMEOUT = 180  # 3 minutes per area (large model)
 
+# Separators - built once at import instead of per dossier
+_SEP60 = "=" * 60
+_DASH60 = "-" * 60
+
+# Whitespace that carries no content for the LLM but costs input tokens
+_TRAILING_WS_RE = re.compile(r'[ \t]+$', re.MULTILINE)
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
 
 BEREICHS_SYNTHESIS_SYSTEM_PROMPT = """You are an academic research assistant.
 
@@ -102,6 +111,12 @@ NO LENGTH LIMIT - as long as needed to be complete.]
 CRITICAL - LANGUAGE: Always respond in the same language as the user's original query shown below."""
 
 
+def _compact_dossier(text: str) -> str:
+    """Drops trailing whitespace and collapses runs of blank lines to one."""
+    text = _TRAILING_WS_RE.sub("", text)
+    return _BLANK_LINES_RE.sub("\n\n", text).strip()
+
+
 def build_bereichs_synthesis_prompt(
     user_query: str,
     bereich_titel: str,
@@ -119,14 +134,13 @@ def build_bereichs_synthesis_prompt(
         (system_prompt, user_prompt)
     """
 
-    # Format dossiers
-    dossiers_text = ""
+    # Format dossiers - collect parts and join once (no quadratic += on large dossiers)
+    parts = []
     for i, d in enumerate(bereich_dossiers, 1):
-        dossiers_text += f"\n{'='*60}\n"
-        dossiers_text += f"DOSSIER {i}: {d['point']}\n"
-        dossiers_text += f"{'='*60}\n"
-        dossiers_text += d['dossier']
-        dossiers_text += f"\n\nSources: {len(d.get('sources', []))} URLs\n"
+        parts.append(f"\n{_SEP60}\nDOSSIER {i}: {d['point']}\n{_SEP60}\n")
+        parts.append(_compact_dossier(d['dossier']))
+        parts.append(f"\n\nSources: {len(d.get('sources', []))} URLs\n")
+    dossiers_text = "".join(parts)
 
     user_prompt = f"""CONTEXT:
 Original research question: "{user_query}"
@@ -134,10 +148,10 @@ Original research question: "{user_query}"
 AREA: {bereich_titel}
 Number of dossiers: {len(bereich_dossiers)}
 
-{'-'*60}
+{_DASH60}
 DOSSIERS OF THIS AREA:
 {dossiers_text}
-{'-'*60}
+{_DASH60}
 
 TASK:
 Synthesize these {len(bereich_dossiers)} dossiers into ONE coherent report
@@ -145,6 +159,6 @@ for the area "{bereich_titel}".
 
 Focus exclusively on this area. Other areas are handled separately."""
 
-    logger.debug(f"Bereichs-Synthesis prompt for '{bereich_titel}': {len(user_prompt)} chars")
+    logger.debug("Bereichs-Synthesis prompt for '%s': %d chars", bereich_titel, len(user_prompt))
 
     return BEREICHS_SYNTHESIS_SYSTEM_PROMPT, user_prompt
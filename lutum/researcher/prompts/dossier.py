@@ -15,6 +15,9 @@ FORMAT v2.0:
 - MANDATORY vs OPTIONAL sections
 """
 
+import re
+import string
+
 DOSSIER_SYSTEM_PROMPT = """You are an expert in scientific analysis and knowledge preparation.
 
 ═══════════════════════════════════════════════════════════════════
@@ -277,6 +280,28 @@ One sentence what subsequent research points should know/consider.
 === END DOSSIER ===
 """
 
+# DOSSIER_USER_PROMPT pre-parsed once into (literal, field_name) pairs.
+# Filling it is a single join - no format-spec scan of the template per call,
+# and the (often 100KB+) scraped content is copied exactly once.
+_USER_PROMPT_SEGMENTS = tuple(
+    (literal, field_name)
+    for literal, field_name, _, _ in string.Formatter().parse(DOSSIER_USER_PROMPT)
+)
+
+
+# Citation line in the SOURCES block: [N] URL - Title (max 5 digits, bounded length).
+# MULTILINE: matched over the whole block, surrounding whitespace of the line
+# is tolerated but never crosses a newline.
+_CITATION_RE = re.compile(r'^[^\S\n]*\[(\d{1,5})\][^\S\n]+(\S(?:.{0,1898}\S)?)[^\S\n]*$', re.MULTILINE)
+
+
+# Key Learnings markers (most specific first) with the markers that end the block
+_KEY_LEARNINGS_MARKERS = (
+    ("## 💡 KEY LEARNINGS", ("=== SOURCES ===", "=== END DOSSIER ===")),
+    ("💡 KEY LEARNINGS", ("=== SOURCES ===", "=== END DOSSIER ===")),
+    ("=== KEY LEARNINGS ===", ("=== END LEARNINGS ===",)),
+)
+
 
 def build_dossier_prompt(
     user_query: str,
@@ -296,12 +321,18 @@ def build_dossier_prompt(
     Returns:
         Tuple (system_prompt, user_prompt)
     """
-    user_prompt = DOSSIER_USER_PROMPT.format(
-        user_query=user_query,
-        current_point=current_point,
-        thinking_block=thinking_block,
-        scraped_content=scraped_content
-    )
+    values = {
+        "user_query": user_query,
+        "current_point": current_point,
+        "thinking_block": thinking_block,
+        "scraped_content": scraped_content,
+    }
+    parts = []
+    for literal, field_name in _USER_PROMPT_SEGMENTS:
+        parts.append(literal)
+        if field_name:
+            parts.append(values[field_name])
+    user_prompt = "".join(parts)
 
     return DOSSIER_SYSTEM_PROMPT, user_prompt
 
@@ -324,8 +355,6 @@ def parse_dossier_response(response: str) -> tuple[str, str, dict]:
         - key_learnings: The Key Learnings block
         - citations: Dict {1: "url - title", 2: "url - title", ...}
     """
-    import re
-
     # Security: Limit response length to prevent ReDoS
     MAX_RESPONSE_LENGTH = 500_000  # 500KB max
     if len(response) > MAX_RESPONSE_LENGTH:
@@ -336,64 +365,45 @@ def parse_dossier_response(response: str) -> tuple[str, str, dict]:
     citations = {}
 
     # Security: Use find() instead of regex to prevent ReDoS
-    sources_start = response.find('=== SOURCES ===')
-    sources_end = response.find('=== END SOURCES ===')
+    # The sources block sits at the tail - search backwards so only the tail is
+    # scanned, and an echoed format example earlier in the text is not picked up
+    sources_start = response.rfind('=== SOURCES ===')
+    sources_end = response.find('=== END SOURCES ===', sources_start) if sources_start >= 0 else -1
 
-    if sources_start >= 0 and sources_end > sources_start:
+    if sources_end >= 0:
         sources_block = response[sources_start + len('=== SOURCES ==='):sources_end]
-        for line in sources_block.strip().split('\n'):
-            line = line.strip()
-            if not line or len(line) > 2000:  # Security: Skip overly long lines
+        # Format: [N] URL - Title (limit to 5 digits = max 99999, title <= 1900 chars)
+        # One regex sweep over the block - only citation lines produce matches
+        for match in _CITATION_RE.finditer(sources_block):
+            # Security: Skip overly long lines - the title is bounded by the regex,
+            # but the whitespace run after [N] is not
+            if match.end(2) - match.start(1) >= 2000:
                 continue
-            # Format: [N] URL - Title (limit to 5 digits = max 99999)
-            match = re.match(r'^\[(\d{1,5})\]\s+(.{1,1900})$', line)
-            if match:
-                num = int(match.group(1))
-                if 1 <= num <= 99999:  # Security: Validate range
-                    url_and_title = match.group(2).strip()
-                    citations[num] = url_and_title
-
-    # Extract Key Learnings (new format: ## 💡 KEY LEARNINGS or 💡 KEY LEARNINGS)
-    # Try with ## first, then without (LLM sometimes omits ##)
-    if "## 💡 KEY LEARNINGS" in response:
-        parts = response.split("## 💡 KEY LEARNINGS")
-        dossier_text = parts[0].strip()
-
-        if len(parts) > 1:
-            learnings_part = parts[1]
-            # Until Sources block or End Marker
-            if "=== SOURCES ===" in learnings_part:
-                key_learnings = learnings_part.split("=== SOURCES ===")[0].strip()
-            elif "=== END DOSSIER ===" in learnings_part:
-                key_learnings = learnings_part.split("=== END DOSSIER ===")[0].strip()
-            else:
-                key_learnings = learnings_part.strip()
-
-    # Fallback 1: Without ## (LLM sometimes omits the ## prefix)
-    elif "💡 KEY LEARNINGS" in response:
-        parts = response.split("💡 KEY LEARNINGS")
-        dossier_text = parts[0].strip()
-
-        if len(parts) > 1:
-            learnings_part = parts[1]
-            # Until Sources block or End Marker
-            if "=== SOURCES ===" in learnings_part:
-                key_learnings = learnings_part.split("=== SOURCES ===")[0].strip()
-            elif "=== END DOSSIER ===" in learnings_part:
-                key_learnings = learnings_part.split("=== END DOSSIER ===")[0].strip()
-            else:
-                key_learnings = learnings_part.strip()
-
-    # Fallback 2: Old format (=== KEY LEARNINGS ===)
-    elif "=== KEY LEARNINGS ===" in response:
-        parts = response.split("=== KEY LEARNINGS ===")
-        dossier_text = parts[0].strip()
-
-        if len(parts) > 1:
-            learnings_part = parts[1]
-            if "=== END LEARNINGS ===" in learnings_part:
-                key_learnings = learnings_part.split("=== END LEARNINGS ===")[0].strip()
-            else:
-                key_learnings = learnings_part.strip()
+            num = int(match.group(1))
+            if 1 <= num <= 99999:  # Security: Validate range
+                citations[num] = match.group(2)
+
+    # Extract Key Learnings - locate markers by offset with bounded find() calls,
+    # slicing only the final pieces (no intermediate head/tail copies).
+    # Order: "## 💡 KEY LEARNINGS", then without ## (LLM sometimes omits it),
+    # then the old format (=== KEY LEARNINGS ===)
+    for marker, end_markers in _KEY_LEARNINGS_MARKERS:
+        marker_start = response.find(marker)
+        if marker_start < 0:
+            continue
+        dossier_text = response[:marker_start].strip()
+        # Only up to a repeated marker, then until Sources block or End Marker
+        body_start = marker_start + len(marker)
+        body_end = response.find(marker, body_start)
+        if body_end < 0:
+            body_end = len(response)
+        for end_marker in end_markers:
+            end = response.find(end_marker, body_start, body_end)
+            if end >= 0:
+                key_learnings = response[body_start:end].strip()
+                break
+        else:
+            key_learnings = response[body_start:body_end].strip()
+        break
 
     return dossier_text, key_learnings, citations
@@ -15,6 +15,10 @@ FORMAT v2.0:
 - MANDATORY vs OPTIONAL sections (generic for ANY research)
 """
 
+from __future__ import annotations
+
+import re
+
 # Model for Final Synthesis (larger model for all dossiers)
 FINAL_SYNTHESIS_MODEL = "anthropic/claude-sonnet-4.5"
 
@@ -373,6 +377,33 @@ Consolidated list of all cited sources:
 """
 
 
+# Parser patterns (compiled once at import)
+_SOURCES_RE = re.compile(r'=== SOURCES ===\n(.+?)\n=== END SOURCES ===', re.DOTALL)
+# One citation per line: [N] URL - Title (surrounding whitespace excluded)
+_CITE_RE = re.compile(r'^[^\S\n]*\[(\d+)\][^\S\n]+(\S(?:.*\S)?)[^\S\n]*$', re.MULTILINE)
+
+
+# Fixed box art around each dossier header - only the title line varies
+_DOSSIER_HEADER_TOP = "\n┌──────────────────────────────────────────────────────────────────────────────┐\n│ DOSSIER "
+_DOSSIER_HEADER_BOTTOM = "\n└──────────────────────────────────────────────────────────────────────────────┘\n\n"
+
+
+def _format_dossier(number: int, dossier: dict) -> str:
+    """Formats one dossier with its header box for the synthesis prompt."""
+    point_title = dossier.get('point', f'Point {number}')
+    if len(point_title) > 60:
+        point_title = point_title[:60] + '...'
+    return "".join((
+        _DOSSIER_HEADER_TOP,
+        str(number),
+        ": ",
+        point_title,
+        _DOSSIER_HEADER_BOTTOM,
+        dossier.get('dossier', ''),
+        "\n",
+    ))
+
+
 def build_final_synthesis_prompt(
     user_query: str,
     research_plan: list[str],
@@ -390,26 +421,12 @@ def build_final_synthesis_prompt(
         Tuple (system_prompt, user_prompt)
     """
     # Format research plan
-    plan_lines = []
-    for i, point in enumerate(research_plan, 1):
-        plan_lines.append(f"{i}. {point}")
-    plan_text = "\n".join(plan_lines)
+    plan_text = "\n".join(f"{i}. {point}" for i, point in enumerate(research_plan, 1))
 
     # Format dossiers
-    dossier_parts = []
-    for i, d in enumerate(all_dossiers, 1):
-        point_title = d.get('point', f'Point {i}')
-        dossier_content = d.get('dossier', '')
-
-        dossier_parts.append(f"""
-┌──────────────────────────────────────────────────────────────────────────────┐
-│ DOSSIER {i}: {point_title[:60]}{'...' if len(point_title) > 60 else ''}
-└──────────────────────────────────────────────────────────────────────────────┘
-
-{dossier_content}
-""")
-
-    dossiers_text = "\n".join(dossier_parts)
+    dossiers_text = "\n".join(
+        _format_dossier(i, d) for i, d in enumerate(all_dossiers, 1)
+    )
 
     user_prompt = FINAL_SYNTHESIS_USER_PROMPT.format(
         user_query=user_query,
@@ -432,28 +449,26 @@ def parse_final_synthesis_response(response: str) -> tuple[str, dict]:
         - report_text: The complete report
         - citations: Dict {1: "url - title", 2: "url - title", ...}
     """
-    import re
-
     report_text = response
     citations = {}
 
     # Extract Sources block
-    sources_match = re.search(
-        r'=== SOURCES ===\n(.+?)\n=== END SOURCES ===',
-        response, re.DOTALL
-    )
+    sources_match = _SOURCES_RE.search(response)
 
     if sources_match:
-        sources_block = sources_match.group(1)
-        for line in sources_block.strip().split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-            # Format: [N] URL - Title
-            match = re.match(r'\[(\d+)\]\s+(.+)', line)
-            if match:
-                num = int(match.group(1))
-                url_and_title = match.group(2).strip()
-                citations[num] = url_and_title
+        # Format: [N] URL - Title - one regex sweep over the block
+        for match in _CITE_RE.finditer(sources_match.group(1)):
+            citations[int(match.group(1))] = match.group(2)
 
     return report_text, citations
+
+
+# Export für einfachen Import
+__all__ = [
+    'FINAL_SYNTHESIS_MODEL',
+    'FINAL_SYNTHESIS_TIMEOUT',
+    'FINAL_SYNTHESIS_SYSTEM_PROMPT',
+    'FINAL_SYNTHESIS_USER_PROMPT',
+    'build_final_synthesis_prompt',
+    'parse_final_synthesis_response',
+]
@@ -390,8 +390,10 @@ async def get_initial_data(
         logger.info(f"[SEARCH] Formatted results length: {len(formatted_results)} chars")
         logger.info(f"[SEARCH] First 2000 chars of search results:\n{formatted_results[:2000]}")
 
-        # LLM picks URLs (with context if available)
-        llm_response = _call_llm_pick_urls(user_message, formatted_results, previous_learnings)
+        # LLM picks URLs (with context if available) - sync call incl. retry backoff -> thread
+        llm_response = await asyncio.to_thread(
+            _call_llm_pick_urls, user_message, formatted_results, previous_learnings
+        )
 
         if not llm_response:
             return {
@@ -296,8 +296,8 @@ async def research_overview(request: OverviewRequest):
         if sid:
             emit_event(sid, "step_progress", "LLM analysiert deine Anfrage...")
 
-        # Overview Queries generieren
-        result = get_overview_queries(request.message)
+        # Overview Queries generieren (LLM-Call inkl. Retry-Backoff im Thread, blockiert sonst den Event Loop)
+        result = await asyncio.to_thread(get_overview_queries, request.message)
 
         # Event: Done
         if sid:
@@ -385,7 +385,7 @@ async def research_run(request: PipelineRequest):
             # === STEP 1: Overview ===
             yield json.dumps({"type": "status", "message": t("getting_overview", lang)}) + "\n"
 
-            result1 = get_overview_queries(user_message)
+            result1 = await asyncio.to_thread(get_overview_queries, user_message)
             context.update(result1)
 
             if context.get("error"):
@@ -535,7 +535,8 @@ async def research_plan(request: PlanRequest):
         if request.academic_mode:
             from lutum.researcher.prompts import create_academic_plan, format_academic_plan
 
-            result = create_academic_plan(context)
+            # LLM-Call inkl. Retry-Backoff im Thread, blockiert sonst den Event Loop
+            result = await asyncio.to_thread(create_academic_plan, context)
 
             if result.get("error"):
                 if sid:
@@ -563,7 +564,7 @@ async def research_plan(request: PlanRequest):
 
         # === NORMAL MODE: Flache Liste ===
         else:
-            result = create_research_plan(context)
+            result = await asyncio.to_thread(create_research_plan, context)
 
             if result.get("error"):
                 if sid:
@@ -635,7 +636,7 @@ async def research_plan_revise(request: PlanReviseRequest):
             emit_event(sid, "step_progress", "Verarbeite dein Feedback...")
 
         # Plan überarbeiten
-        result = revise_research_plan(context, request.feedback)
+        result = await asyncio.to_thread(revise_research_plan, context, request.feedback)
 
         if result.get("error"):
             if sid:
@@ -707,7 +708,7 @@ async def research_deep(request: DeepResearchRequest):
     """
     import json
     import time
-    import requests
+    from lutum.core.llm_client import get_http_session
     from lutum.researcher.search import _execute_all_searches_async, _close_google_session
     from lutum.scrapers.camoufox_scraper import scrape_urls_batch
 
@@ -719,7 +720,7 @@ async def research_deep(request: DeepResearchRequest):
     def call_llm(system_prompt: str, user_prompt: str, model: str = MODEL_FAST, timeout: int = 60, max_tokens: int = 8000) -> Optional[str]:
         """Ruft LLM auf (OpenRouter, OpenAI, Anthropic, Google, HuggingFace)."""
         try:
-            response = requests.post(
+            response = get_http_session().post(
                 BASE_URL,
                 headers=get_api_headers(),
                 json={
@@ -1544,7 +1545,7 @@ async def research_academic(request: AcademicResearchRequest):
     import json
     import time
     import re
-    import requests as http_requests
+    from lutum.core.llm_client import get_http_session
     from lutum.researcher.search import _execute_all_searches_async, _close_google_session
     from lutum.scrapers.camoufox_scraper import scrape_urls_batch
     from lutum.researcher.prompts import (
@@ -1562,6 +1563,7 @@ async def research_academic(request: AcademicResearchRequest):
     )
     from lutum.researcher.prompts.academic_conclusion import (
         build_academic_conclusion_prompt,
+        ACADEMIC_CONCLUSION_MAX_CHARS_PER_AREA,
         ACADEMIC_CONCLUSION_MODEL,
         ACADEMIC_CONCLUSION_TIMEOUT,
     )
@@ -1585,7 +1587,7 @@ async def research_academic(request: AcademicResearchRequest):
     def call_llm(system_prompt: str, user_prompt: str, model: str = MODEL_FAST, timeout: int = 60, max_tokens: int = 8000) -> Optional[str]:
         """Ruft LLM auf (OpenRouter, OpenAI, Anthropic, Google, HuggingFace)."""
         try:
-            response = http_requests.post(
+            response = get_http_session().post(
                 BASE_URL,
                 headers=get_api_headers(),
                 json={
@@ -1919,14 +1921,15 @@ async def research_academic(request: AcademicResearchRequest):
 
                 await asyncio.sleep(0.2)
 
-                # Count total dossiers across all areas
-                total_dossiers = sum(len(s.get('dossiers', [])) for s in all_bereichs_synthesen)
-
                 # DER MAGISCHE CALL - bekommt User-Frage + alle Bereichs-Synthesen
-                system_prompt, user_prompt, conclusion_metrics = build_academic_conclusion_prompt(
+                # Totals (sources, chars, dossiers) werden im selben Durchlauf berechnet
+                # Prompt-Bau (hunderte KB Strings) in Thread, blockiert sonst den Event Loop
+                system_prompt, user_prompt, conclusion_metrics = await asyncio.to_thread(
+                    build_academic_conclusion_prompt,
                     user_query=user_query,
                     bereichs_synthesen=all_bereichs_synthesen,
-                    total_dossiers=total_dossiers,
+                    max_chars_per_area=ACADEMIC_CONCLUSION_MAX_CHARS_PER_AREA,
+                    dedupe_paragraphs=True,
                 )
 
                 # Academic Conclusion in Thread für non-blocking